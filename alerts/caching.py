@@ -0,0 +1,55 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Everything cached about the form catalogue (languages, forms, questions, red flags)
+# is stored under the current catalogue version, so bumping the version retires every
+# entry at once in all processes that share the cache backend.
+CATALOG_VERSION_KEY = "alerts:catalog_version"
+
+
+def catalog_version() -> int:
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # Seed from the clock so a version key lost to eviction never reuses an old number.
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version(**kwargs):
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def bump_catalog_version_on_commit(**kwargs):
+    # Bumping before the writer commits would let a concurrent request rebuild an entry
+    # from the old rows and store it under the new version.
+    transaction.on_commit(bump_catalog_version)
+
+
+def cached_catalog(key: str, build):
+    return cache.get_or_set(key, build, settings.CATALOG_CACHE_TIMEOUT, version=catalog_version())
+
+
+def doctor_cache_key(slug: str) -> str:
+    return f"alerts:doctor:{slug}"
+
+
+def remember_doctor_slug(sender, instance, **kwargs):
+    # A save may change the slug; note the one the cached entry is stored under.
+    instance._stored_slug = (
+        sender.objects.filter(pk=instance.pk).values_list("shareable_slug", flat=True).first()
+        if instance.pk is not None
+        else None
+    )
+
+
+def forget_doctor(sender, instance, **kwargs):
+    slugs = {instance.shareable_slug, getattr(instance, "_stored_slug", None)} - {None}
+    keys = [doctor_cache_key(slug) for slug in slugs]
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,64 @@
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+
+from .caching import cached_catalog
+from .models import Language, OptionRedFlagMap, Question, QuestionCondition
+
+
+def languages_by_code() -> Dict[str, Language]:
+    return cached_catalog("alerts:languages", lambda: {language.code: language for language in Language.objects.all()})
+
+
+def get_language(code: str) -> Language:
+    language = languages_by_code().get(code)
+    if language is None:
+        # Another process may have added it since the map was cached; the database decides.
+        language = get_object_or_404(Language, code=code)
+    return language
+
+
+def red_flags_by_option() -> Dict[str, Tuple[int, ...]]:
+    """Map each option ID to the primary keys of the red flags it raises."""
+    return cached_catalog("alerts:red_flags_by_option", _load_red_flags_by_option)
+
+
+def _load_red_flags_by_option() -> Dict[str, Tuple[int, ...]]:
+    red_flags: Dict[str, list] = {}
+    for option_id, red_flag_pk in OptionRedFlagMap.objects.values_list("option__option_id", "red_flag_id"):
+        red_flags.setdefault(option_id, []).append(red_flag_pk)
+    return {option_id: tuple(pks) for option_id, pks in red_flags.items()}
+
+
+class CompiledForm(NamedTuple):
+    """Branching data for one form as parallel tuples, one slot per question in display order."""
+
+    question_ids: Tuple[str, ...]
+    question_types: Tuple[str, ...]
+    shows_text_field: Tuple[bool, ...]
+    parent_ids: Tuple[Optional[str], ...]
+    trigger_options: Tuple[FrozenSet[str], ...]
+
+
+def compiled_form(form_id: str) -> CompiledForm:
+    return cached_catalog(f"alerts:compiled_form:{form_id}", lambda: _compile_form(form_id))
+
+
+def _compile_form(form_id: str) -> CompiledForm:
+    questions = list(
+        Question.objects.filter(form__form_id=form_id)
+        .select_related("parent_question")
+        .prefetch_related(Prefetch("conditions", queryset=QuestionCondition.objects.select_related("trigger_option")))
+    )
+    return CompiledForm(
+        question_ids=tuple(question.question_id for question in questions),
+        question_types=tuple(question.question_type for question in questions),
+        shows_text_field=tuple(question.shows_text_field for question in questions),
+        parent_ids=tuple(
+            question.parent_question.question_id if question.parent_question else None for question in questions
+        ),
+        trigger_options=tuple(
+            frozenset(qc.trigger_option.option_id for qc in question.conditions.all()) for question in questions
+        ),
+    )
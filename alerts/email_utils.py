@@ -1,5 +1,7 @@
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple
 from django.conf import settings
 from django.template.loader import render_to_string
 from sendgrid import SendGridAPIClient
@@ -7,6 +9,10 @@ from sendgrid.helpers.mail import Mail
 
 logger = logging.getLogger(__name__)
 
+# SendGrid calls are plain HTTPS requests, so a small thread pool keeps them off
+# the request path without needing a task queue.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sendgrid")
+
 
 def send_redflag_email(doctor, submission, red_flags: List[dict]):
     if not settings.SENDGRID_API_KEY:
@@ -17,9 +23,12 @@ def send_redflag_email(doctor, submission, red_flags: List[dict]):
     context = {
         "doctor": doctor,
         "submission": submission,
-        "red_flags": red_flags,
-        "base_url": settings.SITE_BASE_URL,
+        "red_flags_html": _render_red_flag_list(
+            tuple((entry["red_flag"].red_flag_id, entry["doctor_text"]) for entry in red_flags),
+            settings.SITE_BASE_URL,
+        ),
     }
+    # Render on the calling thread, where the ORM objects and DB connection live.
     html_content = render_to_string("alerts/email_report.html", context)
     message = Mail(
         from_email=settings.DEFAULT_FROM_EMAIL,
@@ -27,9 +36,24 @@ def send_redflag_email(doctor, submission, red_flags: List[dict]):
         subject=subject,
         html_content=html_content,
     )
+    _executor.submit(_deliver, message, doctor.email)
+
+
+@lru_cache(maxsize=256)
+def _render_red_flag_list(red_flags: Tuple[Tuple[str, str], ...], base_url: str) -> str:
+    # The rest of the report is per-submission; only the red-flag list repeats
+    # across emails, and its key already holds every input it renders from.
+    return render_to_string("alerts/email_red_flags.html", {"red_flags": red_flags, "base_url": base_url})
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> SendGridAPIClient:
+    return SendGridAPIClient(api_key)
+
+
+def _deliver(message: Mail, recipient: str):
     try:
-        sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-        sg.send(message)
-        logger.info("Sent red flag email to %s", doctor.email)
+        _get_client(settings.SENDGRID_API_KEY).send(message)
+        logger.info("Sent red flag email to %s", recipient)
     except Exception as exc:  # pragma: no cover - integration
         logger.exception("Failed to send SendGrid email: %s", exc)
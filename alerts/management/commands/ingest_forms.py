@@ -1,10 +1,16 @@
 import re
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from openpyxl import load_workbook
 
-import pandas as pd
-from django.core.management.base import BaseCommand, CommandError
+from alerts.caching import bump_catalog_version
 from alerts.models import (
     Form,
     FormTranslation,
@@ -19,6 +25,48 @@ from alerts.models import (
     RedFlagTranslation,
 )
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover - optional dependency
+    CalamineWorkbook = None
+
+OPENPYXL_SUFFIXES = {".xlsx", ".xlsm", ".xltx", ".xltm"}
+# Identifier columns are read as strings so numeric-looking IDs key the same
+# way in every sheet and match the CharField values returned by in_bulk().
+ID_COLUMNS = (
+    "language_code",
+    "form_id",
+    "question_id",
+    "parent_question_id",
+    "option_id",
+    "trigger_option_id",
+    "red_flag_id",
+)
+# Spreadsheet spellings of a checked flag; anything else, including blanks, is False.
+TRUTHY_VALUES = ["true", "1", "1.0", "yes", "y"]
+
+_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _normalize_label(name):
+    # typed=True keeps 1, 1.0 and True apart; they hash equal but normalize differently.
+    return _NORMALIZE_RE.sub("_", str(name).strip().lower()).strip("_")
+
+
+def _present(value):
+    """Scalar notna check for the per-cell loops; NaN is the only value unequal to itself."""
+    return value is not None and value is not pd.NA and value == value
+
+
+def _id_value(value):
+    """Key a raw identifier cell like the string-typed ID columns: 101 and 101.0 as "101", blanks as None."""
+    if not _present(value) or value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
 
 class Command(BaseCommand):
     help = "Ingest forms and translations from the provided spreadsheet"
@@ -32,38 +80,101 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         path = options["spreadsheet"]
+        # Sheets are parsed one at a time, in load order, so only the frames for
+        # the sheet being loaded are alive at any point.
+        with self._open_workbook(path) as read_sheet, transaction.atomic():
+            self._load_languages(read_sheet("Languages")[0])
+            self._cache_languages()
+            self._load_forms(*read_sheet("Forms"))
+            questions = self._load_questions(read_sheet("Questions")[0])
+            df, raw_df = read_sheet("QuestionTranslations")
+            self._load_question_translations(df, questions, raw_df)
+            options = self._load_options(read_sheet("QuestionOptions")[0])
+            self._load_question_conditions(read_sheet("QuestionConditions")[0], questions)
+            df, raw_df = read_sheet("OptionTranslations")
+            self._load_option_translations(df, options, raw_df)
+            redflags = self._load_redflags(read_sheet("Redflags")[0])
+            df, raw_df = read_sheet("RedflagTranslations")
+            self._load_redflag_translations(df, redflags, raw_df)
+            self._load_option_redflag_map(read_sheet("OptionRedFlagMap")[0], options, redflags)
+
+        # Bulk writes send no model signals, so retire cached catalogue views explicitly.
+        bump_catalog_version()
+        self.stdout.write(self.style.SUCCESS("Ingestion complete"))
+
+    # ============================================================
+    # WORKBOOK READING
+    # ============================================================
+
+    @contextmanager
+    def _open_workbook(self, path):
+        """Open the workbook once and yield a reader that parses one sheet per call."""
         try:
-            data = {
-                name: self._normalize_dataframe(df)
-                for name, df in pd.read_excel(path, sheet_name=None).items()
-            }
-            raw_data = {
-                name: df
-                for name, df in pd.read_excel(path, sheet_name=None, header=None).items()
-            }
+            workbook = self._load_workbook(path)
         except Exception as exc:
             raise CommandError(f"Unable to read spreadsheet: {exc}")
+        sheet_names = set(workbook.sheetnames if hasattr(workbook, "sheetnames") else workbook.sheet_names)
 
-        self._load_languages(data.get("Languages"))
-        self._load_forms(data.get("Forms"), raw_data.get("Forms"))
-        questions = self._load_questions(data.get("Questions"))
-        self._load_question_translations(
-            data.get("QuestionTranslations"),
-            questions,
-            raw_data.get("QuestionTranslations")
-        )
-        self._load_question_conditions(data.get("QuestionConditions"), questions)
-        options = self._load_options(data.get("QuestionOptions"))
-        self._load_option_translations(
-            data.get("OptionTranslations"), options, raw_data.get("OptionTranslations")
-        )
-        redflags = self._load_redflags(data.get("Redflags"))
-        self._load_redflag_translations(
-            data.get("RedflagTranslations"), redflags, raw_data.get("RedflagTranslations")
-        )
-        self._load_option_redflag_map(data.get("OptionRedFlagMap"), options, redflags)
+        def read_sheet(name):
+            """Return the (normalized, raw) frames for a sheet, or (None, None) if it is absent."""
+            if name not in sheet_names:
+                return None, None
+            try:
+                raw_df = self._parse_sheet(workbook, name)
+            except Exception as exc:
+                raise CommandError(f"Unable to read sheet '{name}': {exc}")
+            return self._normalize_dataframe(self._with_header(raw_df)), raw_df
 
-        self.stdout.write(self.style.SUCCESS("Ingestion complete"))
+        try:
+            yield read_sheet
+        finally:
+            workbook.close()
+
+    def _load_workbook(self, path):
+        if CalamineWorkbook is not None:
+            try:
+                return CalamineWorkbook.from_path(path)
+            except Exception as exc:
+                self.stderr.write(
+                    self.style.WARNING(f"calamine could not open the workbook ({exc}); falling back to openpyxl/pandas")
+                )
+        if Path(path).suffix.lower() in OPENPYXL_SUFFIXES:
+            return load_workbook(path, read_only=True, data_only=True)
+        return pd.ExcelFile(path)
+
+    def _parse_sheet(self, workbook, name):
+        """Parse a single sheet without treating its first row as a header."""
+        if isinstance(workbook, pd.ExcelFile):
+            return workbook.parse(name, header=None)
+        if CalamineWorkbook is not None and isinstance(workbook, CalamineWorkbook):
+            return self._build_frame(self._calamine_rows(workbook.get_sheet_by_name(name)))
+        worksheet = workbook[name]
+        # Some writers store a stale dimension record that would truncate rows.
+        worksheet.reset_dimensions()
+        return self._build_frame(worksheet.iter_rows(values_only=True))
+
+    def _calamine_rows(self, sheet):
+        # calamine reports every number as a float; keep whole numbers as ints
+        # like openpyxl does so numeric IDs don't turn into "101.0".
+        for row in sheet.to_python():
+            yield [int(cell) if isinstance(cell, float) and cell.is_integer() else cell for cell in row]
+
+    def _build_frame(self, rows):
+        rows = [
+            [None if cell == "" else cell for cell in row]
+            for row in rows
+            if any(cell not in (None, "") for cell in row)
+        ]
+        return pd.DataFrame(rows).fillna(np.nan)
+
+    def _with_header(self, raw_df):
+        if raw_df.empty:
+            return pd.DataFrame()
+        df = raw_df.iloc[1:].reset_index(drop=True)
+        df.columns = [
+            label if _present(label) else f"Unnamed: {idx}" for idx, label in enumerate(raw_df.iloc[0])
+        ]
+        return df
 
     # ============================================================
     # NORMALIZATION + VALIDATION HELPERS
@@ -72,23 +183,66 @@ class Command(BaseCommand):
     def _normalize_dataframe(self, df):
         if df is None:
             return None
-        df = df.copy()
         df.columns = [self._normalize_column(col) for col in df.columns]
+        # Cast column by column: DataFrame.astype() would copy every column it leaves alone.
+        for col in ID_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("string")
         return df
 
     def _normalize_column(self, name):
-        normalized = re.sub(r"[^a-z0-9]+", "_", str(name).strip().lower())
-        return normalized.strip("_")
+        return _normalize_label(name)
+
+    def _coerce_bool_columns(self, df, columns):
+        for column in columns:
+            if column in df.columns:
+                df[column] = df[column].astype(str).str.strip().str.lower().isin(TRUTHY_VALUES)
+
+    def _coerce_int_columns(self, df, columns, sheet_name):
+        for column in columns:
+            if column in df.columns:
+                try:
+                    df[column] = pd.to_numeric(df[column]).astype("Int64")
+                except (TypeError, ValueError) as exc:
+                    raise CommandError(f"Column '{column}' in sheet '{sheet_name}' must hold whole numbers: {exc}")
+                if df[column].isna().any():
+                    raise CommandError(f"Column '{column}' in sheet '{sheet_name}' has blank values")
+
+    def _iter_records(self, df):
+        # Zipping plain tuples skips the per-cell boxing that to_dict("records") does.
+        columns = list(df.columns)
+        for values in df.itertuples(index=False, name=None):
+            yield dict(zip(columns, values))
 
     def _get_required_value(self, row, key, sheet_name):
         if key not in row:
-            available = ", ".join(row.index.astype(str))
+            available = ", ".join(str(column) for column in row)
             raise CommandError(
                 f"Required column '{key}' not found while processing sheet '{sheet_name}'. "
                 f"Available columns: {available}"
             )
         return row.get(key)
 
+    def _bulk_upsert(self, model, objs, unique_fields, update_fields):
+        objs = list(objs)
+        if not objs:
+            return
+        options = {
+            "update_conflicts": True,
+            "update_fields": update_fields,
+            "batch_size": settings.INGEST_BATCH_SIZE,
+        }
+        # MySQL upserts through ON DUPLICATE KEY UPDATE and rejects an explicit conflict target.
+        if connection.features.supports_update_conflicts_with_target:
+            options["unique_fields"] = unique_fields
+        model.objects.bulk_create(objs, **options)
+
+    def _get_related(self, objects_by_id, key, column, sheet_name):
+        try:
+            return objects_by_id[key]
+        except KeyError:
+            raise CommandError(f"Unknown {column} '{key}' referenced in sheet '{sheet_name}'")
+
     def _require_columns(self, df, required, sheet_name):
         missing = [col for col in required if col not in df.columns]
         if missing:
@@ -97,28 +251,49 @@ class Command(BaseCommand):
                 f"Missing columns {missing} in sheet '{sheet_name}'. Available columns: {available}"
             )
 
+    def _translation_columns(self, columns):
+        """Map language codes to the column holding their text in a wide-layout sheet."""
+        available = set(columns)
+        mapping = {}
+        for code, candidates in self._language_column_keys.items():
+            column = next((key for key in candidates if key in available), None)
+            if column is not None:
+                mapping[code] = column
+        return mapping
+
     # ============================================================
     # STACKED-LANGUAGE PARSING
     # ============================================================
 
-    def _resolve_language_from_label(self, label, languages):
-        norm = self._normalize_column(label)
-        for lang in languages.values():
-            if norm in {self._normalize_column(lang.code), self._normalize_column(lang.name)}:
-                return lang
-        return None
-
-    def _parse_language_blocks(self, df, expected_headers, languages):
-        records = []
+    def _cache_languages(self):
+        self._languages = {lang.code: lang for lang in Language.objects.all()}
+        # Column names a wide-layout sheet may use for each language, in lookup order.
+        self._language_column_keys = {
+            code: (code, self._normalize_column(code), self._normalize_column(lang.name))
+            for code, lang in self._languages.items()
+        }
+        # Normalized code/name -> Language; the first language to claim a label wins.
+        self._language_labels = {}
+        for lang in self._languages.values():
+            self._language_labels.setdefault(self._normalize_column(lang.code), lang)
+            self._language_labels.setdefault(self._normalize_column(lang.name), lang)
+
+    def _resolve_language_from_label(self, label):
+        return self._language_labels.get(self._normalize_column(label))
+
+    def _parse_language_blocks(self, df, expected_headers):
+        """Yield one record per data row of a stacked-language sheet, tagged with its language_code."""
         if df is None:
-            return records
+            return
 
-        rows = df.fillna("").values.tolist()
+        rows = df.to_numpy(dtype=object, na_value="").tolist()
+        expected = frozenset(expected_headers)
         current_language = None
         header = []
+        id_columns = []
 
         if len(df.columns) > 0:
-            header_language = self._resolve_language_from_label(df.columns[0], languages)
+            header_language = self._resolve_language_from_label(df.columns[0])
             if header_language:
                 current_language = header_language
 
@@ -126,23 +301,27 @@ class Command(BaseCommand):
             if all(str(cell).strip() == "" for cell in row):
                 continue
 
-            possible_language = self._resolve_language_from_label(row[0], languages)
+            possible_language = self._resolve_language_from_label(row[0])
             if possible_language:
                 current_language = possible_language
                 header = []
                 continue
 
-            normalized_row = [self._normalize_column(cell) for cell in row]
-            if not header and set(expected_headers).issubset(set(normalized_row)):
-                header = normalized_row
+            # Only rows seen before a block's header can be that header; data rows are used raw
+            # apart from their ID cells, which are keyed like the string-typed headered columns.
+            if not header:
+                normalized_row = [self._normalize_column(cell) for cell in row]
+                if expected.issubset(normalized_row):
+                    header = normalized_row
+                    id_columns = [column for column in ID_COLUMNS if column in header]
                 continue
 
-            if current_language and header:
-                entry = {header[idx]: row[idx] for idx in range(min(len(header), len(row)))}
+            if current_language:
+                entry = dict(zip(header, row))
+                for column in id_columns:
+                    entry[column] = _id_value(entry[column])
                 entry["language_code"] = current_language.code
-                records.append(entry)
-
-        return records
+                yield entry
 
     # ============================================================
     # LOADERS
@@ -152,208 +331,281 @@ class Command(BaseCommand):
         if df is None:
             return
         self._require_columns(df, ["language_code", "language_name"], "Languages")
-        for _, row in df.iterrows():
-            Language.objects.update_or_create(
-                code=row["language_code"],
-                defaults={"name": row["language_name"]},
-            )
+        languages = {}
+        for row in self._iter_records(df):
+            languages[row["language_code"]] = Language(code=row["language_code"], name=row["language_name"])
+        self._bulk_upsert(Language, languages.values(), ["code"], ["name"])
 
     def _load_forms(self, df, raw_df=None):
         if df is None:
             return
-        languages = {lang.code: lang for lang in Language.objects.all()}
+        languages = self._languages
+        forms = {}
+        form_names = {}
 
         if "form_id" in df.columns:
             self._require_columns(df, ["form_id"], "Forms")
-            for _, row in df.iterrows():
+            for row in self._iter_records(df):
                 form_id = self._get_required_value(row, "form_id", "Forms")
-                form, _ = Form.objects.update_or_create(
-                    form_id=form_id, defaults={"description": row.get("description", "")}
-                )
-                for code, language in languages.items():
-                    name = row.get(code)
-                    if pd.notna(name):
-                        FormTranslation.objects.update_or_create(
-                            form=form, language=language, defaults={"form_name": name}
-                        )
-            return
-
-        source_df = raw_df if raw_df is not None else df
-        form_rows = self._parse_language_blocks(source_df, ["form_id", "form_name", "description"], languages)
-        for entry in form_rows:
-            form_id = entry.get("form_id")
-            if not form_id:
-                continue
-            form, _ = Form.objects.update_or_create(
-                form_id=form_id, defaults={"description": entry.get("description", "")}
-            )
-            language = languages.get(entry.get("language_code"))
-            form_name = entry.get("form_name")
-            if language and pd.notna(form_name):
-                FormTranslation.objects.update_or_create(
-                    form=form, language=language, defaults={"form_name": form_name}
-                )
+                forms[form_id] = Form(form_id=form_id, description=row.get("description", ""))
+            translation_columns = self._translation_columns(df.columns)
+            if "language_code" in df.columns:
+                # Long layout: one row per form and language, like the other translation sheets.
+                self._require_columns(df, ["language_code", "form_name"], "Forms")
+                names_df = df[["form_id", "language_code", "form_name"]].dropna(subset=["form_name"])
+                for form_id, code, name in names_df.itertuples(index=False, name=None):
+                    if code in languages:
+                        form_names[(form_id, code)] = name
+            elif translation_columns:
+                code_by_column = {column: code for code, column in translation_columns.items()}
+                names_df = df.melt(
+                    id_vars="form_id",
+                    value_vars=list(code_by_column),
+                    var_name="column",
+                    value_name="form_name",
+                ).dropna(subset=["form_name"])
+                for form_id, column, name in names_df.itertuples(index=False, name=None):
+                    form_names[(form_id, code_by_column[column])] = name
+        else:
+            source_df = raw_df if raw_df is not None else df
+            form_rows = self._parse_language_blocks(source_df, ["form_id", "form_name", "description"])
+            for entry in form_rows:
+                form_id = entry.get("form_id")
+                if not form_id:
+                    continue
+                forms[form_id] = Form(form_id=form_id, description=entry.get("description", ""))
+                form_name = entry.get("form_name")
+                if entry.get("language_code") in languages and _present(form_name):
+                    form_names[(form_id, entry["language_code"])] = form_name
+
+        self._bulk_upsert(Form, forms.values(), ["form_id"], ["description"])
+        form_map = Form.objects.only("id", "form_id").in_bulk(list(forms), field_name="form_id")
+        self._bulk_upsert(
+            FormTranslation,
+            [
+                FormTranslation(form=form_map[form_id], language=languages[code], form_name=name)
+                for (form_id, code), name in form_names.items()
+            ],
+            ["form", "language"],
+            ["form_name"],
+        )
 
     def _load_questions(self, df):
-        question_map = {}
         if df is None:
-            return question_map
+            return {}
         self._require_columns(df, ["question_id", "form_id", "sequence_no", "question_type"], "Questions")
-        for _, row in df.iterrows():
+        self._coerce_bool_columns(df, ["shows_text_field"])
+        self._coerce_int_columns(df, ["sequence_no"], "Questions")
+        forms_by_id = Form.objects.only("id", "form_id").in_bulk(
+            df["form_id"].unique().tolist(), field_name="form_id"
+        )
+        questions = {}
+        parent_ids = {}
+        for row in self._iter_records(df):
             form_id = self._get_required_value(row, "form_id", "Questions")
             question_id = self._get_required_value(row, "question_id", "Questions")
-            form = Form.objects.get(form_id=form_id)
-            parent = None
-            if pd.notna(row.get("parent_question_id")):
-                parent = Question.objects.filter(question_id=row.get("parent_question_id")).first()
-            question, _ = Question.objects.update_or_create(
+            form = self._get_related(forms_by_id, form_id, "form_id", "Questions")
+            parent_id = row.get("parent_question_id")
+            parent_ids[question_id] = parent_id if _present(parent_id) else None
+            questions[question_id] = Question(
                 question_id=question_id,
-                defaults={
-                    "form": form,
-                    "sequence_no": row["sequence_no"],
-                    "question_type": row["question_type"],
-                    "branching_type": row.get("branching_type"),
-                    "parent_question": parent,
-                    "shows_text_field": bool(row.get("shows_text_field", False)),
-                },
+                form=form,
+                sequence_no=row["sequence_no"],
+                question_type=row["question_type"],
+                branching_type=row.get("branching_type"),
+                shows_text_field=row.get("shows_text_field", False),
             )
-            question_map[question_id] = question
+        self._bulk_upsert(
+            Question,
+            questions.values(),
+            ["question_id"],
+            ["form", "sequence_no", "question_type", "branching_type", "shows_text_field"],
+        )
+        question_map = Question.objects.only("id", "question_id", "parent_question").in_bulk(
+            list(questions), field_name="question_id"
+        )
+
+        # Parents can appear later in the sheet than their children, so they are
+        # linked in a second pass once every question row exists.
+        existing_parents = Question.objects.only("id", "question_id").in_bulk(
+            [parent_id for parent_id in parent_ids.values() if parent_id and parent_id not in question_map],
+            field_name="question_id",
+        )
+        relinked = []
+        for question_id, parent_id in parent_ids.items():
+            question = question_map[question_id]
+            parent = (question_map.get(parent_id) or existing_parents.get(parent_id)) if parent_id else None
+            if question.parent_question_id != (parent.pk if parent else None):
+                question.parent_question = parent
+                relinked.append(question)
+        Question.objects.bulk_update(relinked, ["parent_question"], batch_size=settings.INGEST_BATCH_SIZE)
         return question_map
 
     def _load_question_translations(self, df, questions, raw_df=None):
         if df is None:
             return
-        languages = {lang.code: lang for lang in Language.objects.all()}
+        languages = self._languages
         if "language_code" in df.columns:
             self._require_columns(df, ["question_id", "language_code", "question_text"], "QuestionTranslations")
-            records = df.to_dict("records")
+            records = self._iter_records(df.dropna(subset=["question_text"]))
         else:
             source_df = raw_df if raw_df is not None else df
-            records = self._parse_language_blocks(source_df, ["question_id", "question_text"], languages)
+            records = self._parse_language_blocks(source_df, ["question_id", "question_text"])
 
+        translations = {}
         for entry in records:
             question = questions.get(entry.get("question_id"))
             language = languages.get(entry.get("language_code"))
             if not question or not language:
                 continue
             question_text = entry.get("question_text")
-            if pd.notna(question_text):
-                QuestionTranslation.objects.update_or_create(
-                    question=question, language=language, defaults={"question_text": question_text}
+            if _present(question_text):
+                translations[(question.pk, language.pk)] = QuestionTranslation(
+                    question=question, language=language, question_text=question_text
                 )
+        self._bulk_upsert(QuestionTranslation, translations.values(), ["question", "language"], ["question_text"])
 
     def _load_question_conditions(self, df, questions):
         if df is None:
             return
         self._require_columns(df, ["question_id", "trigger_option_id"], "QuestionConditions")
-        for _, row in df.iterrows():
+        options_by_id = QuestionOption.objects.only("id", "option_id").in_bulk(
+            df["trigger_option_id"].dropna().unique().tolist(), field_name="option_id"
+        )
+        conditions = {}
+        for row in self._iter_records(df):
             question_id = self._get_required_value(row, "question_id", "QuestionConditions")
             question = questions.get(question_id)
             if not question:
                 continue
             trigger_option_id = self._get_required_value(row, "trigger_option_id", "QuestionConditions")
-            try:
-                option = QuestionOption.objects.get(option_id=trigger_option_id)
-            except QuestionOption.DoesNotExist:
+            option = options_by_id.get(trigger_option_id)
+            if not option:
                 continue
-            QuestionCondition.objects.update_or_create(question=question, trigger_option=option)
+            conditions[(question.pk, option.pk)] = QuestionCondition(question=question, trigger_option=option)
+        QuestionCondition.objects.bulk_create(
+            conditions.values(), ignore_conflicts=True, batch_size=settings.INGEST_BATCH_SIZE
+        )
 
     def _load_options(self, df):
-        options = {}
         if df is None:
-            return options
+            return {}
         self._require_columns(df, ["option_id", "question_id", "sequence_no"], "QuestionOptions")
-        for _, row in df.iterrows():
+        self._coerce_bool_columns(df, ["is_red_flag_option", "shows_text_field"])
+        self._coerce_int_columns(df, ["sequence_no"], "QuestionOptions")
+        questions_by_id = Question.objects.only("id", "question_id").in_bulk(
+            df["question_id"].unique().tolist(), field_name="question_id"
+        )
+        options = {}
+        for row in self._iter_records(df):
             option_id = self._get_required_value(row, "option_id", "QuestionOptions")
             question_id = self._get_required_value(row, "question_id", "QuestionOptions")
-            question = Question.objects.get(question_id=question_id)
-            option, _ = QuestionOption.objects.update_or_create(
+            question = self._get_related(questions_by_id, question_id, "question_id", "QuestionOptions")
+            options[option_id] = QuestionOption(
                 option_id=option_id,
-                defaults={
-                    "question": question,
-                    "sequence_no": row["sequence_no"],
-                    "is_red_flag_option": bool(row.get("is_red_flag_option", False)),
-                    "shows_text_field": bool(row.get("shows_text_field", False)),
-                },
+                question=question,
+                sequence_no=row["sequence_no"],
+                is_red_flag_option=row.get("is_red_flag_option", False),
+                shows_text_field=row.get("shows_text_field", False),
             )
-            options[option_id] = option
-        return options
+        self._bulk_upsert(
+            QuestionOption,
+            options.values(),
+            ["option_id"],
+            ["question", "sequence_no", "is_red_flag_option", "shows_text_field"],
+        )
+        # Downstream loaders only assign these as FKs, so the key columns are enough.
+        return QuestionOption.objects.only("id", "option_id").in_bulk(list(options), field_name="option_id")
 
     def _load_option_translations(self, df, options, raw_df=None):
         if df is None:
             return
-        languages = {lang.code: lang for lang in Language.objects.all()}
+        languages = self._languages
         if "language_code" in df.columns:
             self._require_columns(df, ["option_id", "language_code", "option_text"], "OptionTranslations")
-            records = df.to_dict("records")
+            records = self._iter_records(df.dropna(subset=["option_text"]))
         else:
             source_df = raw_df if raw_df is not None else df
-            records = self._parse_language_blocks(source_df, ["option_id", "option_text"], languages)
+            records = self._parse_language_blocks(source_df, ["option_id", "option_text"])
 
+        translations = {}
         for entry in records:
             option = options.get(entry.get("option_id"))
             language = languages.get(entry.get("language_code"))
             if not option or not language:
                 continue
             option_text = entry.get("option_text")
-            if pd.notna(option_text):
-                OptionTranslation.objects.update_or_create(
-                    option=option, language=language, defaults={"option_text": option_text}
+            if _present(option_text):
+                translations[(option.pk, language.pk)] = OptionTranslation(
+                    option=option, language=language, option_text=option_text
                 )
+        self._bulk_upsert(OptionTranslation, translations.values(), ["option", "language"], ["option_text"])
 
     def _load_redflags(self, df):
-        redflags = {}
         if df is None:
-            return redflags
+            return {}
         self._require_columns(df, ["red_flag_id"], "Redflags")
-        for _, row in df.iterrows():
+        redflags = {}
+        for row in self._iter_records(df):
             red_flag_id = self._get_required_value(row, "red_flag_id", "Redflags")
-            redflag, _ = RedFlag.objects.update_or_create(
+            redflags[red_flag_id] = RedFlag(
                 red_flag_id=red_flag_id,
-                defaults={
-                    "severity": row.get("severity", ""),
-                    "default_patient_response": row.get("default_patient_response", ""),
-                    "patient_video_url": row.get("patient_video_url", ""),
-                    "doctor_at_a_glance": row.get("doctor_at_a_glance", ""),
-                    "doctor_video_url": row.get("doctor_video_url", ""),
-                },
+                severity=row.get("severity", ""),
+                default_patient_response=row.get("default_patient_response", ""),
+                patient_video_url=row.get("patient_video_url", ""),
+                doctor_at_a_glance=row.get("doctor_at_a_glance", ""),
+                doctor_video_url=row.get("doctor_video_url", ""),
             )
-            redflags[red_flag_id] = redflag
-        return redflags
+        self._bulk_upsert(
+            RedFlag,
+            redflags.values(),
+            ["red_flag_id"],
+            ["severity", "default_patient_response", "patient_video_url", "doctor_at_a_glance", "doctor_video_url"],
+        )
+        return RedFlag.objects.only("id", "red_flag_id").in_bulk(list(redflags), field_name="red_flag_id")
 
     def _load_redflag_translations(self, df, redflags, raw_df=None):
         if df is None:
             return
-        languages = {lang.code: lang for lang in Language.objects.all()}
+        languages = self._languages
         if "language_code" in df.columns:
             self._require_columns(df, ["red_flag_id", "language_code"], "RedflagTranslations")
-            records = df.to_dict("records")
+            records = self._iter_records(df)
         else:
             source_df = raw_df if raw_df is not None else df
             records = self._parse_language_blocks(
-                source_df, ["red_flag_id", "patient_response", "doctor_at_a_glance"], languages
+                source_df, ["red_flag_id", "patient_response", "doctor_at_a_glance"]
             )
 
+        translations = {}
         for entry in records:
             redflag = redflags.get(entry.get("red_flag_id"))
             language = languages.get(entry.get("language_code"))
             if not redflag or not language:
                 continue
-            RedFlagTranslation.objects.update_or_create(
+            translations[(redflag.pk, language.pk)] = RedFlagTranslation(
                 red_flag=redflag,
                 language=language,
-                defaults={
-                    "patient_response": entry.get("patient_response", ""),
-                    "doctor_at_a_glance": entry.get("doctor_at_a_glance", ""),
-                },
+                patient_response=entry.get("patient_response", ""),
+                doctor_at_a_glance=entry.get("doctor_at_a_glance", ""),
             )
+        self._bulk_upsert(
+            RedFlagTranslation,
+            translations.values(),
+            ["red_flag", "language"],
+            ["patient_response", "doctor_at_a_glance"],
+        )
 
     def _load_option_redflag_map(self, df, options, redflags):
         if df is None:
             return
         self._require_columns(df, ["option_id", "red_flag_id"], "OptionRedFlagMap")
-        for _, row in df.iterrows():
+        mappings = {}
+        for row in self._iter_records(df):
             option = options.get(row.get("option_id"))
             redflag = redflags.get(row.get("red_flag_id"))
             if option and redflag:
-                OptionRedFlagMap.objects.update_or_create(option=option, red_flag=redflag)
+                mappings[(option.pk, redflag.pk)] = OptionRedFlagMap(option=option, red_flag=redflag)
+        OptionRedFlagMap.objects.bulk_create(
+            mappings.values(), ignore_conflicts=True, batch_size=settings.INGEST_BATCH_SIZE
+        )
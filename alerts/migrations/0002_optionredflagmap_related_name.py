@@ -0,0 +1,18 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("alerts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="optionredflagmap",
+            name="red_flag",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE, related_name="option_maps", to="alerts.redflag"
+            ),
+        ),
+    ]
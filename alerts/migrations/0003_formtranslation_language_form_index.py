@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("alerts", "0002_optionredflagmap_related_name"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="formtranslation",
+            index=models.Index(fields=["language", "form"], name="alerts_form_languag_7e12ae_idx"),
+        ),
+    ]
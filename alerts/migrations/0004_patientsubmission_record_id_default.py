@@ -0,0 +1,16 @@
+from django.db import migrations, models
+import alerts.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("alerts", "0003_formtranslation_language_form_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="patientsubmission",
+            name="record_id",
+            field=models.CharField(default=alerts.models.generate_record_id, max_length=8, unique=True),
+        ),
+    ]
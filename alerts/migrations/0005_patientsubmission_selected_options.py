@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("alerts", "0001_initial_squashed_0004_patientsubmission_record_id_default"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="patientsubmission",
+            name="selected_options",
+            field=models.ManyToManyField(blank=True, related_name="submissions", to="alerts.questionoption"),
+        ),
+    ]
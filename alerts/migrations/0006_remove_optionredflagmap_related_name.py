@@ -0,0 +1,16 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("alerts", "0005_patientsubmission_selected_options"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="optionredflagmap",
+            name="red_flag",
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="alerts.redflag"),
+        ),
+    ]
@@ -1,5 +1,5 @@
 import secrets
-from hashlib import pbkdf2_hmac
+from hashlib import blake2b
 from django.conf import settings
 from django.db import models
 from django.utils.text import slugify
@@ -28,6 +28,8 @@ class FormTranslation(models.Model):
 
     class Meta:
         unique_together = ("form", "language")
+        # The form picker filters by language first; the unique index leads with form.
+        indexes = [models.Index(fields=["language", "form"])]
 
     def __str__(self):
         return f"{self.form.form_id} ({self.language.code})"
@@ -158,9 +160,15 @@ class Doctor(models.Model):
     def save(self, *args, **kwargs):
         if not self.shareable_slug:
             base = slugify(f"{self.name}-{self.clinic_name}") or "doctor"
+            # Fetch every slug sharing the prefix once, then probe suffixes in memory.
+            taken = set(
+                Doctor.objects.filter(shareable_slug__startswith=base)
+                .exclude(pk=self.pk)
+                .values_list("shareable_slug", flat=True)
+            )
             slug = base
             counter = 1
-            while Doctor.objects.filter(shareable_slug=slug).exclude(pk=self.pk).exists():
+            while slug in taken:
                 counter += 1
                 slug = f"{base}-{counter}"
             self.shareable_slug = slug
@@ -179,27 +187,30 @@ class DoctorLink(models.Model):
         return self.link
 
 
+def generate_record_id() -> str:
+    return secrets.token_hex(4)
+
+
 class PatientSubmission(models.Model):
-    record_id = models.CharField(max_length=8, unique=True)
+    record_id = models.CharField(max_length=8, unique=True, default=generate_record_id)
     patient_id = models.CharField(max_length=128, db_index=True)
     doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE, related_name="submissions")
     form = models.ForeignKey(Form, on_delete=models.PROTECT)
     language = models.ForeignKey(Language, on_delete=models.PROTECT)
     responses = models.JSONField()
     red_flags = models.ManyToManyField(RedFlag, related_name="submissions", blank=True)
+    # Options picked in the submission, kept beside the raw responses so per-option
+    # analytics can use the join table's indexes instead of scanning JSON.
+    selected_options = models.ManyToManyField(QuestionOption, related_name="submissions", blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    def save(self, *args, **kwargs):
-        if not self.record_id:
-            self.record_id = secrets.token_hex(4)
-        super().save(*args, **kwargs)
-
     def __str__(self):
         return f"{self.record_id} ({self.doctor_id})"
 
 
 def generate_patient_id(name: str, mobile: str) -> str:
+    # A keyed hash pseudonymizes the patient; the server-held key is what keeps
+    # IDs unguessable, so password-style key stretching buys nothing here.
     raw = f"{name}:{mobile}".encode()
-    secret = settings.PATIENT_ID_SECRET.encode()
-    digest = pbkdf2_hmac("sha256", raw, secret, 100000, dklen=16)
-    return digest.hex()
+    secret = settings.PATIENT_ID_SECRET.encode()[:64]
+    return blake2b(raw, key=secret, digest_size=16).hexdigest()
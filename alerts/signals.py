@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from .caching import bump_catalog_version_on_commit, forget_doctor, remember_doctor_slug
+from .models import (
+    Doctor,
+    Form,
+    FormTranslation,
+    Language,
+    OptionRedFlagMap,
+    OptionTranslation,
+    Question,
+    QuestionCondition,
+    QuestionOption,
+    QuestionTranslation,
+)
+
+# Models whose rows feed the cached catalogue views. Bulk writes skip these signals,
+# so ingest_forms bumps the catalogue version itself once it commits.
+CATALOG_MODELS = (
+    Language,
+    Form,
+    FormTranslation,
+    Question,
+    QuestionTranslation,
+    QuestionOption,
+    OptionTranslation,
+    QuestionCondition,
+    OptionRedFlagMap,
+)
+
+for model in CATALOG_MODELS:
+    for signal in (post_save, post_delete):
+        signal.connect(bump_catalog_version_on_commit, sender=model)
+
+# Doctors are cached per slug rather than per catalogue version; drop just their entries,
+# including the one under the previous slug when a save changes it.
+pre_save.connect(remember_doctor_slug, sender=Doctor)
+post_save.connect(forget_doctor, sender=Doctor)
+post_delete.connect(forget_doctor, sender=Doctor)
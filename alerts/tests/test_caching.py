@@ -0,0 +1,28 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from alerts.caching import catalog_version, doctor_cache_key
+from alerts.models import Doctor, Language
+
+
+class CatalogVersionTests(TestCase):
+    def test_catalog_edit_bumps_version_on_commit(self):
+        version = catalog_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            Language.objects.create(code="fr", name="French")
+            self.assertEqual(catalog_version(), version)
+        self.assertNotEqual(catalog_version(), version)
+
+
+class DoctorCacheTests(TestCase):
+    def test_slug_change_evicts_old_and_new_slug_on_commit(self):
+        doctor = Doctor.objects.create(name="Asha Rao", email="asha@example.com", clinic_name="City Clinic")
+        old_key = doctor_cache_key(doctor.shareable_slug)
+        new_key = doctor_cache_key("asha-rao")
+        cache.set_many({old_key: doctor, new_key: doctor})
+        with self.captureOnCommitCallbacks(execute=True):
+            doctor.shareable_slug = "asha-rao"
+            doctor.save()
+            self.assertIsNotNone(cache.get(old_key))
+        self.assertIsNone(cache.get(old_key))
+        self.assertIsNone(cache.get(new_key))
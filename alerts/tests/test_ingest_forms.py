@@ -0,0 +1,145 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from openpyxl import Workbook
+
+from alerts.models import (
+    Form,
+    FormTranslation,
+    OptionTranslation,
+    Question,
+    QuestionTranslation,
+    RedFlagTranslation,
+)
+
+
+class IngestFormsTests(TestCase):
+    def ingest(self, sheets):
+        """Write {sheet name: rows} to a workbook and run ingest_forms on it."""
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for name, rows in sheets.items():
+            worksheet = workbook.create_sheet(name)
+            for row in rows:
+                worksheet.append(row)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "forms.xlsx"
+            workbook.save(path)
+            call_command("ingest_forms", str(path), stdout=StringIO())
+
+    def languages(self):
+        return [["language_code", "language_name"], ["en", "English"], ["hi", "Hindi"]]
+
+    def assertFormNames(self, expected):
+        self.assertEqual(
+            set(FormTranslation.objects.values_list("form__form_id", "language__code", "form_name")), expected
+        )
+
+    def test_numeric_form_ids_long_layout(self):
+        self.ingest(
+            {
+                "Languages": self.languages(),
+                "Forms": [
+                    ["form_id", "description", "language_code", "form_name"],
+                    [101, "fever form", "en", "Fever"],
+                    [101, "fever form", "hi", "Bukhar"],
+                    [102, "cough form", "en", "Cough"],
+                ],
+            }
+        )
+        self.assertEqual(set(Form.objects.values_list("form_id", flat=True)), {"101", "102"})
+        self.assertFormNames({("101", "en", "Fever"), ("101", "hi", "Bukhar"), ("102", "en", "Cough")})
+
+    def test_numeric_form_ids_wide_layout(self):
+        self.ingest(
+            {
+                "Languages": self.languages(),
+                "Forms": [
+                    ["form_id", "description", "English", "Hindi"],
+                    [101, "fever form", "Fever", "Bukhar"],
+                    [102, "cough form", "Cough", None],
+                ],
+            }
+        )
+        self.assertEqual(set(Form.objects.values_list("form_id", flat=True)), {"101", "102"})
+        self.assertFormNames({("101", "en", "Fever"), ("101", "hi", "Bukhar"), ("102", "en", "Cough")})
+
+    def test_numeric_form_ids_stacked_layout(self):
+        self.ingest(
+            {
+                "Languages": self.languages(),
+                "Forms": [
+                    ["English"],
+                    ["Form ID", "Form Name", "Description"],
+                    [101, "Fever", "fever form"],
+                    [102, "Cough", "cough form"],
+                    ["Hindi"],
+                    ["form_id", "form_name", "description"],
+                    [101, "Bukhar", "fever form"],
+                ],
+            }
+        )
+        self.assertEqual(set(Form.objects.values_list("form_id", flat=True)), {"101", "102"})
+        self.assertFormNames({("101", "en", "Fever"), ("101", "hi", "Bukhar"), ("102", "en", "Cough")})
+
+    def test_numeric_ids_stacked_translations(self):
+        self.ingest(
+            {
+                "Languages": self.languages(),
+                "Forms": [["form_id", "description", "English"], [101, "fever form", "Fever"]],
+                "Questions": [
+                    ["question_id", "form_id", "sequence_no", "question_type"],
+                    [1, 101, 1, "select"],
+                    [2, 101, 2, "text"],
+                ],
+                "QuestionTranslations": [
+                    ["English"],
+                    ["question_id", "question_text"],
+                    [1, "Do you have a fever?"],
+                    [2, "How long?"],
+                    ["Hindi"],
+                    ["question_id", "question_text"],
+                    [1, "Kya bukhar hai?"],
+                ],
+                "QuestionOptions": [["option_id", "question_id", "sequence_no"], [11, 1, 1]],
+                "OptionTranslations": [["English"], ["option_id", "option_text"], [11, "Yes"]],
+                "Redflags": [["red_flag_id", "severity"], [7, "high"]],
+                "RedflagTranslations": [
+                    ["Hindi"],
+                    ["red_flag_id", "patient_response", "doctor_at_a_glance"],
+                    [7, "Aspatal jao", "Dekho"],
+                ],
+            }
+        )
+        self.assertEqual(
+            set(QuestionTranslation.objects.values_list("question__question_id", "language__code", "question_text")),
+            {("1", "en", "Do you have a fever?"), ("2", "en", "How long?"), ("1", "hi", "Kya bukhar hai?")},
+        )
+        self.assertEqual(
+            set(OptionTranslation.objects.values_list("option__option_id", "language__code", "option_text")),
+            {("11", "en", "Yes")},
+        )
+        self.assertEqual(
+            set(RedFlagTranslation.objects.values_list("red_flag__red_flag_id", "language__code", "patient_response")),
+            {("7", "hi", "Aspatal jao")},
+        )
+
+    def test_sequence_no_read_as_integers(self):
+        sheets = {
+            "Languages": self.languages(),
+            "Forms": [["form_id", "description"], ["F1", "fever form"]],
+            "Questions": [
+                ["question_id", "form_id", "sequence_no", "question_type"],
+                ["Q1", "F1", "2", "select"],
+                ["Q2", "F1", 1.0, "text"],
+            ],
+        }
+        self.ingest(sheets)
+        self.assertEqual(list(Question.objects.values_list("question_id", "sequence_no")), [("Q2", 1), ("Q1", 2)])
+
+        sheets["Questions"].append(["Q3", "F1", 1.5, "text"])
+        with self.assertRaisesMessage(CommandError, "Column 'sequence_no' in sheet 'Questions'"):
+            self.ingest(sheets)
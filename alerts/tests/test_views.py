@@ -0,0 +1,85 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from alerts.models import (
+    Doctor,
+    Form,
+    Language,
+    OptionRedFlagMap,
+    PatientSubmission,
+    Question,
+    QuestionCondition,
+    QuestionOption,
+    RedFlag,
+)
+
+
+class PatientFormSubmitTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Language.objects.create(code="en", name="English")
+        form = Form.objects.create(form_id="F1")
+        fever = Question.objects.create(question_id="Q1", form=form, sequence_no=1, question_type=Question.SELECT)
+        days = Question.objects.create(
+            question_id="Q2", form=form, sequence_no=2, question_type=Question.SELECT, parent_question=fever
+        )
+        Question.objects.create(question_id="Q3", form=form, sequence_no=3, question_type=Question.TEXT)
+        yes = QuestionOption.objects.create(option_id="O1", question=fever, sequence_no=1)
+        QuestionOption.objects.create(option_id="O2", question=fever, sequence_no=2)
+        long = QuestionOption.objects.create(option_id="O3", question=days, sequence_no=1)
+        QuestionCondition.objects.create(question=days, trigger_option=yes)
+        cls.high_fever = RedFlag.objects.create(red_flag_id="R1", severity="high")
+        cls.long_fever = RedFlag.objects.create(red_flag_id="R2", severity="medium")
+        OptionRedFlagMap.objects.create(option=yes, red_flag=cls.high_fever)
+        OptionRedFlagMap.objects.create(option=long, red_flag=cls.long_fever)
+        cls.doctor = Doctor.objects.create(name="Asha Rao", email="asha@example.com", clinic_name="City Clinic")
+
+    def setUp(self):
+        # Catalogue rows created inside a test transaction never commit, so nothing bumps the version.
+        cache.clear()
+        session = self.client.session
+        session["patient_name"] = "Ravi"
+        session["patient_mobile"] = "9999999999"
+        session.save()
+        self.url = reverse("alerts:patient_form", args=[self.doctor.shareable_slug, "F1"]) + "?lang=en"
+
+    def submit(self, data):
+        with mock.patch("alerts.views.send_redflag_email") as send:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, 200)
+        return PatientSubmission.objects.get(), send, callbacks
+
+    def selected_option_ids(self, submission):
+        return set(submission.selected_options.values_list("option_id", flat=True))
+
+    def test_triggered_child_links_red_flags_and_queues_email(self):
+        submission, send, callbacks = self.submit({"q_Q1": "O1", "q_Q2": "O3", "q_Q3": "since Monday"})
+        self.assertEqual(submission.responses, {"Q1": "O1", "Q2": "O3", "Q3": "since Monday"})
+        self.assertEqual(set(submission.red_flags.all()), {self.high_fever, self.long_fever})
+        # The free-text answer is not an option ID and must not be linked.
+        self.assertEqual(self.selected_option_ids(submission), {"O1", "O3"})
+        self.assertEqual(len(callbacks), 1)
+        send.assert_called_once()
+        doctor, sent_submission, payload = send.call_args.args
+        self.assertEqual((doctor, sent_submission), (self.doctor, submission))
+        self.assertEqual({entry["red_flag"] for entry in payload}, {self.high_fever, self.long_fever})
+
+    def test_hidden_child_is_skipped(self):
+        submission, send, callbacks = self.submit({"q_Q1": "O2", "q_Q2": "O3"})
+        self.assertNotIn("Q2", submission.responses)
+        self.assertEqual(self.selected_option_ids(submission), {"O2"})
+        self.assertFalse(submission.red_flags.exists())
+        self.assertEqual(callbacks, [])
+        send.assert_not_called()
+
+    def test_unanswered_parent_select_skips_child(self):
+        submission, send, callbacks = self.submit({"q_Q2": "O3"})
+        self.assertIsNone(submission.responses["Q1"])
+        self.assertNotIn("Q2", submission.responses)
+        self.assertEqual(self.selected_option_ids(submission), set())
+        self.assertEqual(callbacks, [])
+        send.assert_not_called()
@@ -1,9 +1,14 @@
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 
+from .caching import cached_catalog, doctor_cache_key
+from .catalog import compiled_form, get_language, languages_by_code, red_flags_by_option
 from .email_utils import send_redflag_email
 from .forms import DoctorCustomizationForm, PatientStartForm
 from .models import (
@@ -12,12 +17,10 @@ from .models import (
     Form,
     FormTranslation,
     Language,
-    OptionRedFlagMap,
     PatientSubmission,
     Question,
     QuestionCondition,
     QuestionOption,
-    QuestionTranslation,
     RedFlag,
     RedFlagTranslation,
     generate_patient_id,
@@ -38,19 +41,40 @@ def doctor_setup(request: HttpRequest) -> HttpResponse:
     return render(request, "alerts/doctor_setup.html", {"form": form, "link": link})
 
 
+def _get_doctor(slug: str) -> Doctor:
+    # Patient links hit the same doctor on every page; unknown slugs are not cached.
+    key = doctor_cache_key(slug)
+    doctor = cache.get(key)
+    if doctor is None:
+        doctor = get_object_or_404(Doctor, shareable_slug=slug)
+        cache.set(key, doctor, settings.CATALOG_CACHE_TIMEOUT)
+    return doctor
+
+
 def _language_choices() -> List[tuple]:
-    return [(lang.code, lang.name) for lang in Language.objects.all()]
+    return [(lang.code, lang.name) for lang in languages_by_code().values()]
 
 
 def _form_choices(language_code: str) -> List[tuple]:
-    translations = FormTranslation.objects.filter(language__code=language_code)
-    if not translations.exists():
-        translations = FormTranslation.objects.filter(language__code="en")
-    return [(ft.form.form_id, ft.form_name) for ft in translations]
+    return cached_catalog(f"alerts:form_choices:{language_code}", lambda: _load_form_choices(language_code))
+
+
+def _load_form_choices(language_code: str) -> List[tuple]:
+    # One query for both the requested and English names; English fills in per form.
+    rows = (
+        FormTranslation.objects.filter(language__code__in={language_code, "en"})
+        .order_by("pk")
+        .values_list("form__form_id", "language__code", "form_name")
+    )
+    choices = {}
+    for form_id, code, form_name in rows:
+        if code == language_code or form_id not in choices:
+            choices[form_id] = form_name
+    return list(choices.items())
 
 
 def patient_start(request: HttpRequest, slug: str) -> HttpResponse:
-    doctor = get_object_or_404(Doctor, shareable_slug=slug)
+    doctor = _get_doctor(slug)
     language_choices = _language_choices()
     form_choices = _form_choices(language_code="en")
 
@@ -77,103 +101,134 @@ def patient_start(request: HttpRequest, slug: str) -> HttpResponse:
     )
 
 
-def _get_question_text(question: Question, language: Language) -> str:
-    try:
-        return question.translations.get(language=language).question_text
-    except QuestionTranslation.DoesNotExist:
-        return question.translations.filter(language__code="en").first().question_text
+def _translations_by_language(instance) -> Dict[int, object]:
+    """Map language id to translation row, built once per instance from its translations."""
+    cached = getattr(instance, "_translations_by_language", None)
+    if cached is None:
+        cached = {translation.language_id: translation for translation in instance.translations.all()}
+        instance._translations_by_language = cached
+    return cached
+
 
+def _get_question_text(question: Question, language: Language, fallback_language_id: Optional[int]) -> str:
+    translations = _translations_by_language(question)
+    translation = translations.get(language.pk) or translations.get(fallback_language_id)
+    return translation.question_text if translation else question.question_id
 
-def _option_text(option: QuestionOption, language: Language) -> str:
-    try:
-        return option.translations.get(language=language).option_text
-    except OptionTranslation.DoesNotExist:
-        fallback = option.translations.filter(language__code="en").first()
-        return fallback.option_text if fallback else option.option_id
+
+def _option_text(option: QuestionOption, language: Language, fallback_language_id: Optional[int]) -> str:
+    translations = _translations_by_language(option)
+    translation = translations.get(language.pk) or translations.get(fallback_language_id)
+    return translation.option_text if translation else option.option_id
 
 
 def _redflag_patient_text(redflag: RedFlag, language: Language) -> str:
-    try:
-        return redflag.translations.get(language=language).patient_response
-    except RedFlagTranslation.DoesNotExist:
-        return redflag.default_patient_response
+    translation = _translations_by_language(redflag).get(language.pk)
+    return translation.patient_response if translation else redflag.default_patient_response
 
 
 def _redflag_doctor_text(redflag: RedFlag, language: Language) -> str:
-    try:
-        return redflag.translations.get(language=language).doctor_at_a_glance
-    except RedFlagTranslation.DoesNotExist:
-        return redflag.doctor_at_a_glance
+    translation = _translations_by_language(redflag).get(language.pk)
+    return translation.doctor_at_a_glance if translation else redflag.doctor_at_a_glance
 
 
-def _question_conditions_met(question: Question, answers: Dict[str, List[str]]) -> bool:
-    if not question.parent_question:
-        return True
-    if not question.conditions.exists():
+def _question_conditions_met(
+    parent_id: Optional[str], trigger_options: FrozenSet[str], chosen: Dict[str, FrozenSet[str]]
+) -> bool:
+    if not parent_id or not trigger_options:
         return True
-    parent_answer = answers.get(question.parent_question.question_id, [])
-    if isinstance(parent_answer, str):
-        parent_answer = [parent_answer]
-    trigger_options = {qc.trigger_option.option_id for qc in question.conditions.all()}
-    return any(opt in trigger_options for opt in parent_answer)
+    return bool(trigger_options & chosen.get(parent_id, frozenset()))
+
+
+def _render_questions(form: Form, language: Language) -> List[dict]:
+    questions = list(
+        form.questions.select_related("parent_question").prefetch_related(
+            "translations",
+            "options__translations",
+            Prefetch("conditions", queryset=QuestionCondition.objects.select_related("trigger_option")),
+        )
+    )
+
+    # Translations are keyed by language id, so resolve the English fallback's id up front.
+    english = languages_by_code().get("en")
+    fallback_language_id = english.pk if english else None
+    rendered_questions = []
+    for question in questions:
+        rendered_question = {
+            "id": question.question_id,
+            "text": _get_question_text(question, language, fallback_language_id),
+            "type": question.question_type,
+            "parent_id": question.parent_question.question_id if question.parent_question else None,
+            "shows_text_field": question.shows_text_field,
+            "conditions": [qc.trigger_option.option_id for qc in question.conditions.all()],
+            "options": [
+                {
+                    "id": option.option_id,
+                    "text": _option_text(option, language, fallback_language_id),
+                    "shows_text_field": option.shows_text_field,
+                }
+                for option in question.options.all()
+            ],
+        }
+        rendered_questions.append(rendered_question)
+    return rendered_questions
 
 
 def patient_form(request: HttpRequest, slug: str, form_id: str) -> HttpResponse:
-    doctor = get_object_or_404(Doctor, shareable_slug=slug)
+    doctor = _get_doctor(slug)
     form = get_object_or_404(Form, form_id=form_id)
     language_code = request.GET.get("lang", "en")
-    language = get_object_or_404(Language, code=language_code)
+    language = get_language(language_code)
 
     patient_name = request.session.get("patient_name")
     patient_mobile = request.session.get("patient_mobile")
     if not patient_name or not patient_mobile:
         return redirect(reverse("alerts:patient_start", args=[slug]))
 
-    questions = list(form.questions.select_related("parent_question").prefetch_related("options__translations", "conditions"))
-
     if request.method == "POST":
+        # Branching is evaluated from the cached compiled form, without loading question rows.
+        compiled = compiled_form(form.form_id)
         answers: Dict[str, List[str]] = {}
-        for question in questions:
-            if not _question_conditions_met(question, answers):
+        # Option IDs picked per question, kept as sets so branching is a plain intersection.
+        chosen: Dict[str, FrozenSet[str]] = {}
+        for question_id, question_type, shows_text_field, parent_id, trigger_options in zip(
+            compiled.question_ids,
+            compiled.question_types,
+            compiled.shows_text_field,
+            compiled.parent_ids,
+            compiled.trigger_options,
+        ):
+            if not _question_conditions_met(parent_id, trigger_options, chosen):
                 continue
-            key = f"q_{question.question_id}"
-            if question.question_type == Question.TEXT:
-                answers[question.question_id] = request.POST.get(key, "")
-            elif question.question_type == Question.SELECT:
-                answers[question.question_id] = request.POST.get(key)
+            key = f"q_{question_id}"
+            if question_type == Question.TEXT:
+                answers[question_id] = request.POST.get(key, "")
+            elif question_type == Question.SELECT:
+                answers[question_id] = request.POST.get(key)
             else:
-                answers[question.question_id] = request.POST.getlist(key)
+                answers[question_id] = request.POST.getlist(key)
+            value = answers[question_id]
+            if value:
+                chosen[question_id] = frozenset(value) if isinstance(value, list) else frozenset((value,))
 
-            if question.shows_text_field:
-                answers[f"{question.question_id}_text"] = request.POST.get(f"{key}_text", "")
+            if shows_text_field:
+                answers[f"{question_id}_text"] = request.POST.get(f"{key}_text", "")
 
-        red_flag_ids = set()
-        for question in questions:
-            value = answers.get(question.question_id)
-            if not value:
-                continue
-            selected_options = value if isinstance(value, list) else [value]
-            for option_id in selected_options:
-                try:
-                    option = QuestionOption.objects.get(option_id=option_id)
-                except QuestionOption.DoesNotExist:
-                    continue
-                red_flag_ids.update(
-                    OptionRedFlagMap.objects.filter(option=option).values_list("red_flag__red_flag_id", flat=True)
-                )
+        selected_option_ids = frozenset().union(*chosen.values())
 
-        red_flags = list(RedFlag.objects.filter(red_flag_id__in=red_flag_ids))
-        patient_id = generate_patient_id(patient_name, patient_mobile)
-        submission = PatientSubmission.objects.create(
-            patient_id=patient_id,
-            doctor=doctor,
-            form=form,
-            language=language,
-            responses=answers,
+        # Unknown IDs, including free-text answers, simply drop out of both lookups.
+        selected_options = QuestionOption.objects.only("id", "option_id").in_bulk(
+            list(selected_option_ids), field_name="option_id"
         )
-        if red_flags:
-            submission.red_flags.set(red_flags)
-
+        option_red_flags = red_flags_by_option()
+        red_flag_pks = set().union(*(option_red_flags.get(option_id, ()) for option_id in selected_option_ids))
+        red_flags = list(
+            RedFlag.objects.filter(pk__in=red_flag_pks).prefetch_related(
+                # The payload only needs this language; a miss falls back to the RedFlag's own fields.
+                Prefetch("translations", queryset=RedFlagTranslation.objects.filter(language=language))
+            )
+        )
+        patient_id = generate_patient_id(patient_name, patient_mobile)
         red_flag_payload = [
             {
                 "red_flag": rf,
@@ -183,8 +238,27 @@ def patient_form(request: HttpRequest, slug: str, form_id: str) -> HttpResponse:
             for rf in red_flags
         ]
 
-        if red_flag_payload:
-            send_redflag_email(doctor, submission, red_flag_payload)
+        with transaction.atomic():
+            submission = PatientSubmission.objects.create(
+                patient_id=patient_id,
+                doctor=doctor,
+                form=form,
+                language=language,
+                responses=answers,
+            )
+            if red_flags:
+                # The submission is brand new, so skip set()'s diffing and insert the links in one statement.
+                through = PatientSubmission.red_flags.through
+                through.objects.bulk_create(
+                    [through(patientsubmission=submission, redflag=red_flag) for red_flag in red_flags]
+                )
+            through = PatientSubmission.selected_options.through
+            through.objects.bulk_create(
+                [through(patientsubmission=submission, questionoption=option) for option in selected_options.values()]
+            )
+            if red_flag_payload:
+                # Only alert the doctor about a submission that was actually stored.
+                transaction.on_commit(lambda: send_redflag_email(doctor, submission, red_flag_payload))
 
         return render(
             request,
@@ -197,25 +271,9 @@ def patient_form(request: HttpRequest, slug: str, form_id: str) -> HttpResponse:
             },
         )
 
-    rendered_questions = []
-    for question in questions:
-        rendered_question = {
-            "id": question.question_id,
-            "text": _get_question_text(question, language),
-            "type": question.question_type,
-            "parent_id": question.parent_question.question_id if question.parent_question else None,
-            "shows_text_field": question.shows_text_field,
-            "conditions": [qc.trigger_option.option_id for qc in question.conditions.all()],
-            "options": [
-                {
-                    "id": option.option_id,
-                    "text": _option_text(option, language),
-                    "shows_text_field": option.shows_text_field,
-                }
-                for option in question.options.all()
-            ],
-        }
-        rendered_questions.append(rendered_question)
+    rendered_questions = cached_catalog(
+        f"alerts:rendered_questions:{form.form_id}:{language.code}", lambda: _render_questions(form, language)
+    )
 
     return render(
         request,